@@ -21,6 +21,8 @@
 MOCK_CFG=$(basename "$1" | sed 's/.cfg$//')
 RPMS_DIR=.
 RPMS_SUFFIX=.rpm
+LIBREPO_RPMS_DIR="$HOME/rpmbuild/RPMS"
+MOCK_RESULT_DIR="/var/lib/mock/$MOCK_CFG/result"
 echo "Testing all projects and code using $1..."
 
 # Initialize the modified mock.
@@ -48,7 +50,7 @@ echo "Building librepo RPMs from the GIT repository in $MOCK_CFG mock..."
 cd librepo
 ./librepo-git2rpm-in-mock.sh .. "$MOCK_CFG" "$2" "../$RPMS_DIR"/*"$RPMS_SUFFIX" > ../librepo-build.log 2>&1; LIBREPO_EXIT=$?
 mv librepo-*.src"$RPMS_SUFFIX" "../$RPMS_DIR"
-mv "$HOME/rpmbuild/RPMS"/*librepo-*"$RPMS_SUFFIX" "../$RPMS_DIR"
+mv "$LIBREPO_RPMS_DIR"/*librepo-*"$RPMS_SUFFIX" "../$RPMS_DIR"
 cd ..
 if [ $LIBREPO_EXIT -eq 0 ]; then
 	echo "...build succeeded."
@@ -60,9 +62,9 @@ fi
 echo "Building libcomps RPMs from the GIT repository in $MOCK_CFG mock..."
 cd libcomps
 ./libcomps-git2rpm.sh .. "$MOCK_CFG" "$2" "../$RPMS_DIR"/*"$RPMS_SUFFIX"; LIBCOMPS_EXIT=$?
-mv "/var/lib/mock/$MOCK_CFG/result"/*libcomps-*"$RPMS_SUFFIX" "../$RPMS_DIR"
-mv "/var/lib/mock/$MOCK_CFG/result/installed_pkgs" ../libcomps-installed_pkgs
-mv "/var/lib/mock/$MOCK_CFG/result/build.log" ../libcomps-build.log
+mv "$MOCK_RESULT_DIR"/*libcomps-*"$RPMS_SUFFIX" "../$RPMS_DIR"
+mv "$MOCK_RESULT_DIR/installed_pkgs" ../libcomps-installed_pkgs
+mv "$MOCK_RESULT_DIR/build.log" ../libcomps-build.log
 cd ..
 if [ $LIBCOMPS_EXIT -eq 0 ]; then
 	echo "...build succeeded."
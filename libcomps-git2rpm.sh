@@ -19,27 +19,28 @@
 # Red Hat, Inc.
 
 # Convert the GIT repository to a source archive and make the SPEC file.
-python --version >>/dev/null 2>&1; PYTHON_EXIT=$?
+# Look the tools up with the shell builtin instead of executing them.
+command -v python >>/dev/null 2>&1; PYTHON_EXIT=$?
 case "$PYTHON_EXIT" in
 	# Python is installed.
 	0) 		IS_PYTHON=0;;
 	# Python is not installed.
-	127)	echo "WARNING: python is not installed" 1>&2
+	*)		echo "WARNING: python is not installed" 1>&2
 			IS_PYTHON=1;;
 esac
-git --version >>/dev/null 2>&1; GIT_EXIT=$?
+command -v git >>/dev/null 2>&1; GIT_EXIT=$?
 case "$GIT_EXIT" in
 	# GIT is installed.
 	0) 		IS_GIT=0;;
 	# GIT is not installed.
-	127)	echo "WARNING: git is not installed" 1>&2
+	*)		echo "WARNING: git is not installed" 1>&2
 			IS_GIT=1;;
 esac
 if [ $(($IS_PYTHON + $IS_GIT)) -eq 0 ]; then
-	./build_prep.py;
+	./build_prep.py || exit $?
 else
 	echo "WARNING: => using mock" 1>&2
-	./libcomps-git2src-make-spec-in-mock.sh "$1" "$2"
+	./libcomps-git2src-make-spec-in-mock.sh "$1" "$2" || exit $?
 fi
 SRC_DIR=.
 SPEC_PATH=libcomps.spec
@@ -51,7 +52,7 @@ SPEC_PATH=libcomps.spec
 SRPM_DIR=.
 SRPM_GLOB="$SRPM_DIR"/libcomps-*.src.rpm
 rm --force "$SRPM_DIR"/$SRPM_GLOB
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --buildsrpm --spec "$SPEC_PATH" --sources "$SRC_DIR"
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --buildsrpm --spec "$SPEC_PATH" --sources "$SRC_DIR" || exit $?
 mv "/var/lib/mock/$2/result"/$SRPM_GLOB "$SRPM_DIR"
 
 # Build the RPMs.
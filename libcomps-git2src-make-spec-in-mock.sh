@@ -20,9 +20,9 @@
 
 MOCK_DIR=/tmp/libcomps-git2src-make-spec-in-mock
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "rm --recursive --force '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR"
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR" || exit $?
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "chown --recursive :mockbuild '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --install python git
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --install python git || exit $?
 
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --unpriv --shell "cd '$MOCK_DIR' && ./build_prep.py"; EXIT=$?
 
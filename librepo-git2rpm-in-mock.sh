@@ -20,15 +20,18 @@
 
 MOCK_DIR=/tmp/librepo-git2rpm
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "rm --recursive --force '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "chown --recursive :mockbuild '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "chmod --recursive +w '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --install wget yum git check-devel cmake expat-devel gcc glib2-devel gpgme-devel libattr-devel libcurl-devel openssl-devel python-devel python3-devel pygpgme python3-pygpgme python-flask python3-flask python-nose python3-nose pyxattr python3-pyxattr doxygen python-sphinx python3-sphinx
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "ln --symbolic --force /builddir/build \"\$HOME/rpmbuild\""
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR" || exit $?
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "chown --recursive :mockbuild '$MOCK_DIR' && chmod --recursive +w '$MOCK_DIR' && ln --symbolic --force /builddir/build \"\$HOME/rpmbuild\""
+
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --install wget yum git check-devel cmake expat-devel gcc glib2-devel gpgme-devel libattr-devel libcurl-devel openssl-devel python-devel python3-devel pygpgme python3-pygpgme python-flask python3-flask python-nose python3-nose pyxattr python3-pyxattr doxygen python-sphinx python3-sphinx || exit $?
 
 # Install dependencies.
-if [ $# -gt 2 ]; then
-	/usr/bin/mock --quiet --configdir="$1" --root="$2" --install ${*:4};
+if [ $# -gt 3 ]; then
+	case "$4" in
+		# The caller's RPM glob matched no files.
+		*'*'*)	;;
+		*)		/usr/bin/mock --quiet --configdir="$1" --root="$2" --install ${*:4};;
+	esac
 fi
 
 # Build RPM.
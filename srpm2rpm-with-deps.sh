@@ -18,11 +18,15 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 
-/usr/bin/mock --quiet --configdir="$2" --root="$3" --init
+/usr/bin/mock --quiet --configdir="$2" --root="$3" --init || exit $?
 
 # Install dependencies.
 if [ $# -gt 3 ]; then
-	/usr/bin/mock --quiet --configdir="$2" --root="$3" --install ${*:4};
+	case "$4" in
+		# The caller's RPM glob matched no files.
+		*'*'*)	;;
+		*)		/usr/bin/mock --quiet --configdir="$2" --root="$3" --install ${*:4} || exit $?;;
+	esac
 fi
 
 # Build RPM.
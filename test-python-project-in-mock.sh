@@ -20,8 +20,8 @@
 
 MOCK_DIR=/tmp/test-python-project-in-mock
 /usr/bin/mock --quiet --configdir="$3" --root="$4" --chroot "rm --recursive --force '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$3" --root="$4" --copyin . "$MOCK_DIR"
+/usr/bin/mock --quiet --configdir="$3" --root="$4" --copyin . "$MOCK_DIR" || exit $?
 /usr/bin/mock --quiet --configdir="$3" --root="$4" --chroot "chown --recursive :mockbuild '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$3" --root="$4" --install python-nose python3-nose
+/usr/bin/mock --quiet --configdir="$3" --root="$4" --install python-nose python3-nose || exit $?
 
 /usr/bin/mock --quiet --configdir="$3" --root="$4" --unpriv --shell "cd '$MOCK_DIR'; ./test-python-project.sh '$1' '$2'"
@@ -19,20 +19,29 @@
 # Red Hat, Inc.
 
 export PYTHONPATH="$2:$PYTHONPATH"
+# Run each pass in its own copy of the tree so that files written by one
+# pass cannot affect the others, then print the logs in order.
+WORK_DIR=$(mktemp --directory)
+trap 'rm --recursive --force "$WORK_DIR"' EXIT
+for RUN in 1 2 3; do
+	cp --archive . "$WORK_DIR/$RUN" || exit $?
+done
 
 # Run tests with default environment.
-export LANG=en_US.UTF-8
-export LC_ALL=en_US.UTF-8
-nosetests-$1 --quiet tests; EXIT1=$?
+(cd "$WORK_DIR/1" && LANG=en_US.UTF-8 LC_ALL=en_US.UTF-8 nosetests-$1 --quiet tests) > "$WORK_DIR/1.log" 2>&1 &
+PID1=$!
 
 # Run tests with cs locale.
-export LANG=cs_CZ.utf8
-export LC_ALL=cs_CZ.utf8
-nosetests-$1 --quiet tests; EXIT2=$?
+(cd "$WORK_DIR/2" && LANG=cs_CZ.utf8 LC_ALL=cs_CZ.utf8 nosetests-$1 --quiet tests) > "$WORK_DIR/2.log" 2>&1 &
+PID2=$!
 
 # Run tests without capturing the output.
-export LANG=en_US.UTF-8
-export LC_ALL=en_US.UTF-8
-nosetests-$1 --quiet --nocapture tests; EXIT3=$?
+(cd "$WORK_DIR/3" && LANG=en_US.UTF-8 LC_ALL=en_US.UTF-8 nosetests-$1 --quiet --nocapture tests) > "$WORK_DIR/3.log" 2>&1 &
+PID3=$!
+
+wait $PID1; EXIT1=$?
+wait $PID2; EXIT2=$?
+wait $PID3; EXIT3=$?
+cat "$WORK_DIR/1.log" "$WORK_DIR/2.log" "$WORK_DIR/3.log"
 
 exit $(($EXIT1 + $EXIT2 + $EXIT3))
@@ -20,9 +20,9 @@
 
 MOCK_DIR=/tmp/test-python3-code-in-mock
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "rm --recursive --force '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR"
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --copyin . "$MOCK_DIR" || exit $?
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --chroot "chmod --recursive a+rwx '$MOCK_DIR'"
-/usr/bin/mock --quiet --configdir="$1" --root="$2" --install python3-pep8 python3-pyflakes pylint
+/usr/bin/mock --quiet --configdir="$1" --root="$2" --install python3-pep8 python3-pyflakes pylint || exit $?
 
 /usr/bin/mock --quiet --configdir="$1" --root="$2" --unpriv --shell "cd '$MOCK_DIR'; ./test-python3-code.sh"; EXIT=$?
 
@@ -18,11 +18,28 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 
-python3 -m pep8 . > pep8.log 2>&1; PEP_EXIT=$?
-python3-pyflakes . > pyflakes.log 2>&1; PYFLAKES_EXIT=$?
+# The linters are independent so run pep8 and pyflakes next to pylint.
+python3 -m pep8 . > pep8.log 2>&1 &
+PEP_PID=$!
+python3-pyflakes . > pyflakes.log 2>&1 &
+PYFLAKES_PID=$!
+PYLINT_TEMPLATE="{path}:{line}: [{msg_id}({symbol}), {obj}] {msg}"
+PYLINT_ARGS=
+PYLINT_DUPLICATES=0
+# Parallel checking needs pylint 1.4 or newer. Its workers do not share the
+# similarity checker, so duplicate code is then checked in a serial pass.
+if pylint --help 2>/dev/null | grep --quiet -- '--jobs'; then
+	PYLINT_ARGS="--jobs=$(nproc) --disable=duplicate-code"
+	PYLINT_DUPLICATES=1
+fi
 PYLINT_EXIT=0
 rm --force pylint.log
 for SUBDIR in */; do
-	pylint --msg-template="{path}:{line}: [{msg_id}({symbol}), {obj}] {msg}" "./$SUBDIR" >> pylint.log 2>&1; PYLINT_EXIT=$(($PYLINT_EXIT | $?))  # According to man pages, they can be ORed.
+	pylint $PYLINT_ARGS --msg-template="$PYLINT_TEMPLATE" "./$SUBDIR" >> pylint.log 2>&1; PYLINT_EXIT=$(($PYLINT_EXIT | $?))  # According to man pages, they can be ORed.
+	if [ $PYLINT_DUPLICATES -eq 1 ]; then
+		pylint --disable=all --enable=duplicate-code --reports=n --msg-template="$PYLINT_TEMPLATE" "./$SUBDIR" >> pylint.log 2>&1; PYLINT_EXIT=$(($PYLINT_EXIT | $?))
+	fi
 done
+wait $PEP_PID; PEP_EXIT=$?
+wait $PYFLAKES_PID; PYFLAKES_EXIT=$?
 exit $(($PEP_EXIT + $PYFLAKES_EXIT + $PYLINT_EXIT))